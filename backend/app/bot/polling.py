@@ -26,17 +26,9 @@ REBOOT_STATE_FILE = Path(os.getenv("SERVER_MONITOR_REBOOT_STATE_FILE", "/app/dat
 boot_tracker = BootTracker(REBOOT_STATE_FILE)
 
 
-def _allowed_user_ids() -> set[str]:
-    return {entry for entry in (settings.telegram_allowed_users or []) if entry.isdigit()}
-
-
-def _allowed_usernames() -> set[str]:
-    return {entry.lower() for entry in (settings.telegram_allowed_users or []) if not entry.isdigit()}
-
-
 def _is_authorized(update: Update) -> bool:
-    allowed_ids = _allowed_user_ids()
-    allowed_usernames = _allowed_usernames()
+    allowed_ids = settings.allowed_user_ids
+    allowed_usernames = settings.allowed_usernames
     if not allowed_ids and not allowed_usernames:
         return True
 
@@ -44,7 +36,7 @@ def _is_authorized(update: Update) -> bool:
     if not user:
         return False
 
-    if allowed_ids and user.id is not None and str(user.id) in allowed_ids:
+    if allowed_ids and user.id is not None and user.id in allowed_ids:
         return True
     if allowed_usernames and user.username and user.username.lower() in allowed_usernames:
         return True
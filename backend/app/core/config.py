@@ -1,4 +1,4 @@
-from functools import lru_cache
+from functools import cached_property, lru_cache
 import json
 from typing import List
 
@@ -25,6 +25,8 @@ class Settings(BaseSettings):
     db_host: str = "localhost"
     db_port: int = 3306
     db_name: str = "server_monitor"
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
 
     # Authentication options
     admin_api_token: str = "change-me"  # Legacy token, superseded by username/password auth
@@ -105,6 +107,16 @@ class Settings(BaseSettings):
             cleaned.append(token)
         return cleaned
 
+    @cached_property
+    def allowed_user_ids(self) -> frozenset[int]:
+        """Numeric Telegram user ids from ``telegram_allowed_users``."""
+        return frozenset(int(entry) for entry in self.telegram_allowed_users if entry.isdigit())
+
+    @cached_property
+    def allowed_usernames(self) -> frozenset[str]:
+        """Lower-cased Telegram usernames from ``telegram_allowed_users``."""
+        return frozenset(entry.lower() for entry in self.telegram_allowed_users if not entry.isdigit())
+
     def sqlalchemy_database_uri(self) -> str:
         """Build a SQLAlchemy connection string."""
         return (
@@ -13,13 +13,17 @@ def ensure_schema_compat(connection: Connection) -> None:
 
     # Add backend_version column if missing (introduced in 2025-02).
     if inspector.has_table("metric_snapshots"):
-        columns = {col["name"] for col in inspector.get_columns("metric_snapshots")}
+        column_info = {col["name"]: col for col in inspector.get_columns("metric_snapshots")}
+        columns = set(column_info)
         if "backend_version" not in columns:
             connection.execute(text("ALTER TABLE metric_snapshots ADD COLUMN backend_version VARCHAR(40) NULL"))
         if "network_counters" not in columns:
             connection.execute(text("ALTER TABLE metric_snapshots ADD COLUMN network_counters JSON NULL"))
         if "disk_temperatures" not in columns:
             connection.execute(text("ALTER TABLE metric_snapshots ADD COLUMN disk_temperatures JSON NULL"))
+        # raw_payload became optional once monitors stopped sending a duplicate of the payload (2026-10).
+        if "raw_payload" in column_info and not column_info["raw_payload"].get("nullable", True):
+            connection.execute(text("ALTER TABLE metric_snapshots MODIFY COLUMN raw_payload JSON NULL"))
 
     # Add ping fields to quick status items if missing (introduced in 2025-03).
     if inspector.has_table("quick_status_items"):
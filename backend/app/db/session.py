@@ -1,4 +1,8 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from backend.app.core.config import settings
 
@@ -7,6 +11,10 @@ engine = create_async_engine(
     settings.sqlalchemy_database_uri(),
     echo=settings.debug,
     future=True,
+    poolclass=AsyncAdaptedQueuePool,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_pre_ping=True,
 )
 
 async_session_factory = async_sessionmaker(
@@ -16,6 +24,17 @@ async_session_factory = async_sessionmaker(
 )
 
 
+async def warm_pool(target: AsyncEngine = engine, connections: int | None = None) -> None:
+    """Open pooled connections up front so the first requests do not pay the connect cost."""
+    count = settings.db_pool_size if connections is None else connections
+
+    async def _ping() -> None:
+        async with target.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(max(0, count))))
+
+
 async def get_session() -> AsyncSession:
     """FastAPI dependency that yields a database session."""
     async with async_session_factory() as session:
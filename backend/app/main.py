@@ -4,7 +4,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.app.core.config import settings
-from backend.app.db.session import async_session_factory, engine
+from backend.app.db.session import async_session_factory, engine, warm_pool
 from backend.app.models.base import Base
 from backend.app.routers import auth, backends, dashboard, metrics, telegram
 from backend.app.routers import system
@@ -23,6 +23,7 @@ async def lifespan(app: FastAPI):
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(ensure_schema_compat)
+    await warm_pool()
     await poller.start()
     async with async_session_factory() as session:
         await notify_reboot_recovery(session)
@@ -47,7 +47,7 @@ class MetricSnapshot(TimestampMixin, Base):
     os_version: Mapped[str | None] = mapped_column(String(120))
     uptime_seconds: Mapped[int | None] = mapped_column(Integer)
     warnings: Mapped[list[str] | None] = mapped_column(JSON)
-    raw_payload: Mapped[dict] = mapped_column(JSON)
+    raw_payload: Mapped[dict | None] = mapped_column(JSON, nullable=True)
 
     backend: Mapped[MonitoredBackend] = relationship("MonitoredBackend", back_populates="snapshots")
 
@@ -8,12 +8,12 @@ from sqlalchemy.orm import selectinload
 
 from backend.app.core.security import get_current_user
 from backend.app.db.session import get_session
-from backend.app.models.monitors import MetricSnapshot, MonitoredBackend, QuickStatusItem
+from backend.app.models.monitors import MetricSnapshot, MonitoredBackend
 from backend.app.schemas.backend import BackendWithLatestSnapshot
 from backend.app.schemas.common import MetricSnapshotRead
 from backend.app.schemas.metrics import MetricSeriesPoint, MetricSeriesResponse
 from backend.app.schemas.quick_status import QuickStatusTileRead
-from backend.app.services.quick_status import build_quick_status_tiles
+from backend.app.services.quick_status import build_quick_status_tiles, list_quick_status_items
 
 
 router = APIRouter(prefix="/dashboard", tags=["dashboard"])
@@ -54,12 +54,7 @@ async def fetch_quick_status_tiles(
     _: object = Depends(get_current_user),
     session: AsyncSession = Depends(get_session),
 ) -> list[QuickStatusTileRead]:
-    result = await session.execute(
-        select(QuickStatusItem)
-        .options(selectinload(QuickStatusItem.backend))
-        .order_by(QuickStatusItem.display_order, QuickStatusItem.id)
-    )
-    items = list(result.scalars())
+    items = await list_quick_status_items(session)
     return await build_quick_status_tiles(session, items)
 
 
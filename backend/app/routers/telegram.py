@@ -14,7 +14,7 @@ from backend.app.services.telegram_notifications import (
     send_warn_message,
 )
 from backend.app.services.reboot_service import request_reboot
-from backend.app.services.telegram_settings import get_or_create_settings
+from backend.app.services.telegram_settings import get_or_create_settings, invalidate_settings_cache
 from backend.app.services.warnings import recalculate_latest_snapshot_warnings
 from backend.app.services.telegram_service import TelegramError, send_message
 from backend.app.models.monitors import MonitoredBackend
@@ -45,12 +45,13 @@ async def update_settings(
     payload: TelegramSettingsUpdate,
     session: AsyncSession = Depends(get_session),
 ) -> TelegramSettingsRead:
-    settings_model = await get_or_create_settings(session)
+    settings_model = await get_or_create_settings(session, use_cache=False)
     for key, value in payload.model_dump().items():
         setattr(settings_model, key, value)
     session.add(settings_model)
     await session.commit()
     await session.refresh(settings_model)
+    invalidate_settings_cache()
 
     response = TelegramSettingsRead.model_validate(settings_model)
 
@@ -94,12 +95,11 @@ def _extract_command(message: dict | None) -> str | None:
         return None
     text = _extract_text(message)
     if isinstance(text, str):
-        parts = text.strip().split()
-        if parts and parts[0].startswith("/"):
-            command = parts[0].lower()
-            if "@" in command:
-                command = command.split("@", 1)[0]
-            return command
+        stripped = text.lstrip()
+        if stripped.startswith("/"):
+            # Only the first token matters; maxsplit=1 avoids splitting the rest of the message.
+            head = stripped.split(None, 1)[0]
+            return head.partition("@")[0].lower()
 
     # Some updates include commands in captions (e.g. photo + command)
     # Fall back to entity parsing when text does not directly expose the command
@@ -137,19 +137,16 @@ def _extract_command_and_args(message: dict | None) -> tuple[str | None, list[st
 
 
 def _is_authorized_user(message: dict | None) -> bool:
-    allowed = getattr(settings, "telegram_allowed_users", None) or []
-    if not allowed:
+    allowed_ids = settings.allowed_user_ids
+    allowed_usernames = settings.allowed_usernames
+    if not allowed_ids and not allowed_usernames:
         return True
 
-    message = message or {}
-    allowed_ids = {entry for entry in allowed if entry.isdigit()}
-    allowed_usernames = {entry.lower() for entry in allowed if not entry.isdigit()}
-
-    user = message.get("from") or {}
+    user = (message or {}).get("from") or {}
     user_id = user.get("id")
     username = user.get("username")
 
-    if user_id is not None and str(user_id) in allowed_ids:
+    if isinstance(user_id, int) and user_id in allowed_ids:
         return True
     if isinstance(username, str) and username.lower() in allowed_usernames:
         return True
@@ -34,7 +34,7 @@ def build_snapshot_model(backend_id: int, payload: MetricSnapshotCreate) -> Metr
         os_version=payload.os_version,
         uptime_seconds=payload.uptime_seconds,
         warnings=payload.warnings,
-        raw_payload=payload.raw_payload or payload.model_dump(),
+        raw_payload=payload.raw_payload,
     )
     return snapshot
 
@@ -9,7 +9,7 @@ import ping3
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import joinedload
 
 from backend.app.core.config import settings
 from backend.app.models.monitors import MetricSnapshot, QuickStatusItem
@@ -168,7 +168,7 @@ async def _check_ping(item: QuickStatusItem) -> PingCheckResult | None:
 async def list_quick_status_items(session: AsyncSession) -> list[QuickStatusItem]:
     result = await session.execute(
         select(QuickStatusItem)
-        .options(selectinload(QuickStatusItem.backend))
+        .options(joinedload(QuickStatusItem.backend))
         .order_by(QuickStatusItem.display_order, QuickStatusItem.id)
     )
     return list(result.scalars())
@@ -203,7 +203,8 @@ async def build_quick_status_tiles(
 
     tiles: list[QuickStatusTileRead] = []
     for item in items_list:
-        backend = getattr(item, "backend", None)
+        backend = item.backend
+        backend_name = backend.name if backend else "Unknown"
         snapshot = snapshots.get(item.backend_id)
         ping_result = await _check_ping(item) if item.metric_key in _PING_METRICS else None
         value = _metric_value(snapshot, item.metric_key, item.mount_path) if snapshot else None
@@ -235,7 +236,7 @@ async def build_quick_status_tiles(
             QuickStatusTileRead(
                 id=item.id,
                 backend_id=item.backend_id,
-                backend_name=backend.name if backend else "Unknown",
+                backend_name=backend_name,
                 label=item.label,
                 metric_key=item.metric_key,
                 value=value,
@@ -5,11 +5,13 @@ import os
 import logging
 import shlex
 import shutil
+import signal
 import subprocess
 from datetime import datetime, timezone
 
+import httpx
 from fastapi import HTTPException, status
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.config import settings
@@ -32,6 +34,22 @@ def _try_sysrq_reboot() -> bool:
         return False
 
 
+async def _spawn_and_wait(args: list[str], timeout: float = 10) -> int:
+    """Start ``args`` via posix_spawn (no fork of this process) and wait for it to exit."""
+    pid = os.posix_spawn(args[0], args, os.environ)
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while True:
+        waited_pid, wait_status = os.waitpid(pid, os.WNOHANG)
+        if waited_pid:
+            return os.waitstatus_to_exitcode(wait_status)
+        if loop.time() >= deadline:
+            os.kill(pid, signal.SIGKILL)
+            os.waitpid(pid, 0)
+            raise subprocess.TimeoutExpired(args, timeout)
+        await asyncio.sleep(0.05)
+
+
 async def _run_reboot_command() -> None:
     """Spawn the configured reboot command in a worker thread."""
     if not settings.reboot_command:
@@ -76,7 +94,21 @@ async def _run_reboot_command() -> None:
     candidates = _candidate_commands()
     errors: list[str] = []
 
+    spawned = False
     for attempt_args in candidates:
+        # The first executable candidate skips subprocess' fork+exec; output is not captured there.
+        if not spawned and hasattr(os, "posix_spawn") and os.access(attempt_args[0], os.X_OK):
+            spawned = True
+            try:
+                returncode = await _spawn_and_wait(attempt_args)
+            except (OSError, subprocess.TimeoutExpired) as exc:
+                errors.append(f"{' '.join(attempt_args)}: {exc}")
+                continue
+            if returncode == 0:
+                return
+            errors.append(f"{' '.join(attempt_args)}: {returncode}")
+            continue
+
         def _execute():
             return subprocess.run(
                 attempt_args,
@@ -167,26 +199,50 @@ async def notify_reboot_recovery(session: AsyncSession) -> None:
     result = await session.execute(
         select(RebootEvent).where(RebootEvent.back_notified_at.is_(None)).order_by(RebootEvent.created_at.asc())
     )
+    events = list(result.scalars())
+    if not events:
+        return
     settings_model, default_chat = await resolve_message_context(session, None, strict=False)
 
-    for event in result.scalars():
+    handled_ids: list[int] = []
+    pending: list[tuple[RebootEvent, str]] = []
+    for event in events:
         target_chat = event.chat_id or default_chat
         if not settings_model or not target_chat or not settings_model.bot_token:
             # Nothing to notify; mark as handled to avoid repeating on every startup.
-            event.back_notified_at = datetime.now(tz=timezone.utc)
-            session.add(event)
-            await session.commit()
+            handled_ids.append(event.id)
             continue
+        pending.append((event, str(target_chat)))
 
+    async def _send_recovery(event: RebootEvent, target_chat: str) -> None:
         text = (
             f"Server is back online after reboot requested by {event.requested_by} "
             f"at {event.created_at.astimezone(timezone.utc).strftime('%Y-%m-%d %H:%M UTC')}."
         )
-        try:
-            await send_message(settings_model.bot_token, str(target_chat), text)
-            event.back_notified_at = datetime.now(tz=timezone.utc)
-            session.add(event)
-            await session.commit()
-        except TelegramError as exc:
-            logger.warning("Failed to send reboot recovery notice: %s", exc)
+        await send_message(settings_model.bot_token, target_chat, text)
+
+    outcomes = await asyncio.gather(
+        *(_send_recovery(event, target_chat) for event, target_chat in pending),
+        return_exceptions=True,
+    )
+    unexpected: BaseException | None = None
+    for (event, _), outcome in zip(pending, outcomes):
+        if isinstance(outcome, (TelegramError, httpx.HTTPError)):
+            logger.warning("Failed to send reboot recovery notice: %s", outcome)
             # Do not mark as notified; will retry on next startup.
+            continue
+        if isinstance(outcome, BaseException):
+            unexpected = unexpected or outcome
+            continue
+        handled_ids.append(event.id)
+
+    # Persist delivered notices before surfacing any unexpected error so they are not re-sent.
+    if handled_ids:
+        await session.execute(
+            update(RebootEvent)
+            .where(RebootEvent.id.in_(handled_ids))
+            .values(back_notified_at=datetime.now(tz=timezone.utc))
+        )
+        await session.commit()
+    if unexpected is not None:
+        raise unexpected
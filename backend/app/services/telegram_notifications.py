@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Callable, Sequence
 
@@ -30,6 +31,9 @@ async def fetch_backends_with_latest(
         query = query.where(MonitoredBackend.id == backend_id)
     if backend_name:
         query = query.where(MonitoredBackend.name.ilike(f"%{backend_name}%"))
+    if backend_id is not None or backend_name:
+        # Filtered lookups only ever report on the first match.
+        query = query.limit(1)
 
     result = await session.execute(query)
     backends: list[BackendWithLatestSnapshot] = []
@@ -45,6 +49,17 @@ async def fetch_backends_with_latest(
     return backends
 
 
+async def _fetch_backends_in_sibling_session(
+    session: AsyncSession,
+    *,
+    backend_id: int | None = None,
+    backend_name: str | None = None,
+) -> list[BackendWithLatestSnapshot]:
+    """Run the backend lookup on a separate session so it can overlap with other queries."""
+    async with AsyncSession(session.bind, expire_on_commit=False) as sibling:
+        return await fetch_backends_with_latest(sibling, backend_id=backend_id, backend_name=backend_name)
+
+
 async def resolve_message_context(
     session: AsyncSession,
     chat_id: str | None,
@@ -76,13 +91,21 @@ async def send_compiled_message(
     backend_id: int | None = None,
     backend_name: str | None = None,
 ) -> str:
-    settings_model, target_chat = await resolve_message_context(session, chat_id, strict=True)
-    backends = await fetch_backends_with_latest(session, backend_id=backend_id, backend_name=backend_name)
+    # AsyncSession cannot run statements concurrently, so the backend fetch uses its own pooled session.
+    fetch = asyncio.create_task(
+        _fetch_backends_in_sibling_session(session, backend_id=backend_id, backend_name=backend_name)
+    )
+    try:
+        settings_model, target_chat = await resolve_message_context(session, chat_id, strict=True)
+    except BaseException:
+        # Nothing will be sent, so stop the lookup and retrieve its outcome instead of orphaning it.
+        fetch.cancel()
+        await asyncio.gather(fetch, return_exceptions=True)
+        raise
+    backends = await fetch
     if backend_id is not None or backend_name:
         if not backends:
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Backend not found")
-        # Only the first match is needed when filtering by name to keep messages concise.
-        backends = backends[:1]
     text = builder(backends)
     try:
         await send_message(settings_model.bot_token, target_chat, text)
@@ -1,14 +1,34 @@
 from __future__ import annotations
 
-from sqlalchemy import select
+import asyncio
+import time
+from typing import Any
+
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from backend.app.core.config import settings
 from backend.app.models.monitors import TelegramSettings as TelegramSettingsModel
 from backend.app.schemas.telegram import WarnThresholds
 
 
-async def get_or_create_settings(session: AsyncSession) -> TelegramSettingsModel:
+SETTINGS_CACHE_TTL_SECONDS = 60.0
+
+# Last loaded settings row, keyed by the engine it came from; write paths must invalidate it.
+_SETTINGS_CACHE: dict[str, Any] = {"row": None, "bind": None, "ts": 0.0, "generation": 0}
+_SETTINGS_LOCK = asyncio.Lock()
+
+# Last parsed thresholds keyed by the raw JSON blob they were validated from.
+_THRESHOLDS_CACHE: tuple[dict, WarnThresholds] | None = None
+
+
+def invalidate_settings_cache() -> None:
+    # Bumping the generation also stops a fill that is still awaiting its query from storing.
+    _SETTINGS_CACHE.update(row=None, bind=None, ts=0.0, generation=_SETTINGS_CACHE["generation"] + 1)
+
+
+async def _load_or_create_settings(session: AsyncSession) -> TelegramSettingsModel:
     result = await session.execute(select(TelegramSettingsModel).limit(1))
     instance = result.scalars().first()
     if instance is None:
@@ -23,12 +43,52 @@ async def get_or_create_settings(session: AsyncSession) -> TelegramSettingsModel
     return instance
 
 
+def _detached_copy(row: TelegramSettingsModel) -> TelegramSettingsModel:
+    # A separate instance, so a rollback or close of the loading session cannot expire the
+    # cached values, and the caller's own attached row is left in its session.
+    columns = inspect(TelegramSettingsModel).column_attrs
+    copy = TelegramSettingsModel(**{column.key: getattr(row, column.key) for column in columns})
+    make_transient_to_detached(copy)
+    return copy
+
+
+async def get_or_create_settings(session: AsyncSession, *, use_cache: bool = True) -> TelegramSettingsModel:
+    """Return the Telegram settings row.
+
+    Read-only callers get a detached, fully loaded row cached for SETTINGS_CACHE_TTL_SECONDS,
+    so it stays readable whatever happens to the session that loaded it. Callers that modify
+    the row must pass ``use_cache=False`` and call ``invalidate_settings_cache`` after committing.
+    """
+    if not use_cache:
+        return await _load_or_create_settings(session)
+    bind = getattr(session, "bind", None)
+    async with _SETTINGS_LOCK:
+        row = _SETTINGS_CACHE["row"]
+        if (
+            row is not None
+            and _SETTINGS_CACHE["bind"] is bind
+            and time.monotonic() - _SETTINGS_CACHE["ts"] < SETTINGS_CACHE_TTL_SECONDS
+        ):
+            return row
+        generation = _SETTINGS_CACHE["generation"]
+        row = _detached_copy(await _load_or_create_settings(session))
+        if _SETTINGS_CACHE["generation"] == generation:
+            _SETTINGS_CACHE.update(row=row, bind=bind, ts=time.monotonic())
+        return row
+
+
 async def get_warn_thresholds(session: AsyncSession) -> WarnThresholds | None:
     settings_model = await get_or_create_settings(session)
     raw_thresholds = settings_model.warn_thresholds
     if not raw_thresholds:
         return None
+    global _THRESHOLDS_CACHE
+    cached = _THRESHOLDS_CACHE
+    if cached is not None and cached[0] == raw_thresholds:
+        return cached[1]
     try:
-        return WarnThresholds.model_validate(raw_thresholds)
+        parsed = WarnThresholds.model_validate(raw_thresholds)
     except Exception:  # pragma: no cover - defensive parsing for legacy data
         return None
+    _THRESHOLDS_CACHE = (dict(raw_thresholds), parsed)
+    return parsed
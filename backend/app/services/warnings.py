@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.models.monitors import MetricSnapshot, MonitoredBackend
@@ -12,6 +12,13 @@ DEFAULT_CPU_TEMP = 80.0
 DEFAULT_RAM_PERCENT = 90.0
 DEFAULT_DISK_PERCENT = 90.0
 
+# (metric/threshold field, default threshold, message template) checked in order by detect_warnings.
+_METRIC_WARNINGS = (
+    ("cpu_temperature_c", DEFAULT_CPU_TEMP, "High CPU temperature {:.1f}°C"),
+    ("ram_used_percent", DEFAULT_RAM_PERCENT, "High RAM usage {:.1f}%"),
+    ("disk_usage_percent", DEFAULT_DISK_PERCENT, "Disk usage critical at {:.1f}%"),
+)
+
 
 def _resolve_threshold(value: float | None, default: float) -> float:
     return float(value) if isinstance(value, (int, float)) else default
@@ -47,27 +54,16 @@ def _mount_label(entry: Any) -> str:
 def detect_warnings(payload: Any, thresholds: WarnThresholds) -> list[str]:
     """Recalculate warnings for a payload using the configured thresholds."""
 
-    cpu_limit = _resolve_threshold(thresholds.cpu_temperature_c, DEFAULT_CPU_TEMP)
-    ram_limit = _resolve_threshold(thresholds.ram_used_percent, DEFAULT_RAM_PERCENT)
-    disk_limit = _resolve_threshold(thresholds.disk_usage_percent, DEFAULT_DISK_PERCENT)
-    mount_limit = thresholds.mounted_usage_percent
-    if mount_limit is None:
-        mount_limit = disk_limit
-
     warnings: list[str] = []
+    for key, default, template in _METRIC_WARNINGS:
+        limit = _resolve_threshold(getattr(thresholds, key), default)
+        value = _get_value(payload, key)
+        if isinstance(value, (int, float)) and value >= limit:
+            warnings.append(template.format(value))
 
-    temp = _get_value(payload, "cpu_temperature_c")
-    if isinstance(temp, (int, float)) and temp >= cpu_limit:
-        warnings.append(f"High CPU temperature {temp:.1f}°C")
-
-    ram_percent = _get_value(payload, "ram_used_percent")
-    if isinstance(ram_percent, (int, float)) and ram_percent >= ram_limit:
-        warnings.append(f"High RAM usage {ram_percent:.1f}%")
-
-    disk_percent = _get_value(payload, "disk_usage_percent")
-    if isinstance(disk_percent, (int, float)) and disk_percent >= disk_limit:
-        warnings.append(f"Disk usage critical at {disk_percent:.1f}%")
-
+    mount_limit = thresholds.mounted_usage_percent
+    if mount_limit is None:
+        mount_limit = _resolve_threshold(thresholds.disk_usage_percent, DEFAULT_DISK_PERCENT)
     for volume in _iter_mounts(payload):
         percent = _mount_percent(volume)
         if isinstance(percent, (int, float)) and percent >= mount_limit:
@@ -82,38 +78,43 @@ async def recalculate_latest_snapshot_warnings(
 ) -> None:
     """Apply the latest thresholds to each backend's most recent snapshot."""
 
-    latest_snapshot_sq = (
+    # Rank snapshots per backend so exactly one (the newest) row is picked, even on reported_at ties.
+    ranked_sq = (
         select(
-            MetricSnapshot.backend_id.label("backend_id"),
-            func.max(MetricSnapshot.reported_at).label("reported_at"),
+            MetricSnapshot.id.label("snapshot_id"),
+            func.row_number()
+            .over(
+                partition_by=MetricSnapshot.backend_id,
+                order_by=(MetricSnapshot.reported_at.desc(), MetricSnapshot.id.desc()),
+            )
+            .label("snapshot_rank"),
         )
-        .group_by(MetricSnapshot.backend_id)
         .subquery()
     )
 
-    result = await session.execute(
+    stream = await session.stream_scalars(
         select(MetricSnapshot)
-        .join(
-            latest_snapshot_sq,
-            (MetricSnapshot.backend_id == latest_snapshot_sq.c.backend_id)
-            & (MetricSnapshot.reported_at == latest_snapshot_sq.c.reported_at),
-        )
+        .join(ranked_sq, MetricSnapshot.id == ranked_sq.c.snapshot_id)
+        .where(ranked_sq.c.snapshot_rank == 1)
     )
-    snapshots = list(result.scalars())
-    if not snapshots:
+    # Only keep the computed values around, not the ORM rows themselves.
+    snapshot_updates: list[dict[str, Any]] = []
+    backend_warnings: dict[int, list[str]] = {}
+    async for snapshot in stream:
+        warnings = detect_warnings(snapshot, thresholds)
+        snapshot_updates.append({"id": snapshot.id, "warnings": warnings or None})
+        backend_warnings[snapshot.backend_id] = warnings
+    if not snapshot_updates:
         return
 
-    backend_ids = {snapshot.backend_id for snapshot in snapshots}
-    backend_rows = await session.execute(
-        select(MonitoredBackend).where(MonitoredBackend.id.in_(backend_ids))
+    # Bulk UPDATE by primary key: one executemany per table instead of loading and flushing each row.
+    await session.execute(update(MetricSnapshot), snapshot_updates)
+    await session.execute(
+        update(MonitoredBackend),
+        [
+            {"id": backend_id, "last_warning": "; ".join(warnings) if warnings else None}
+            for backend_id, warnings in backend_warnings.items()
+        ],
     )
-    backend_map = {backend.id: backend for backend in backend_rows.scalars()}
-
-    for snapshot in snapshots:
-        warnings = detect_warnings(snapshot, thresholds)
-        snapshot.warnings = warnings or None
-        backend = backend_map.get(snapshot.backend_id)
-        if backend:
-            backend.last_warning = "; ".join(warnings) if warnings else None
 
     await session.commit()
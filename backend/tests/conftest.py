@@ -1,22 +1,79 @@
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager
 
+import pytest
 import pytest_asyncio
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
+from sqlalchemy.orm import raiseload
 
 from backend.app.models.base import Base
 
 
+def _raise_on_implicit_loads(orm_execute_state) -> None:
+    # Regression guard: any relationship not loaded explicitly raises instead of lazy-loading
+    # (an N+1 in production). Explicit loader options still take precedence over the wildcard.
+    if orm_execute_state.is_select and not (
+        orm_execute_state.is_column_load or orm_execute_state.is_relationship_load
+    ):
+        orm_execute_state.statement = orm_execute_state.statement.options(raiseload("*"))
+
+
 @pytest_asyncio.fixture
 async def db_session() -> AsyncIterator[AsyncSession]:
     engine = create_async_engine("sqlite+aiosqlite:///:memory:", future=True)
-    async_session_factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+
+    # pysqlite's implicit transaction handling breaks SAVEPOINTs; let SQLAlchemy emit BEGIN itself.
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
 
     try:
-        async with async_session_factory() as session:
-            yield session
-            await session.rollback()
+        async with engine.connect() as conn:
+            transaction = await conn.begin()
+            # Service-level commit() calls only release a SAVEPOINT; everything is rolled back below.
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
+            event.listen(session.sync_session, "do_orm_execute", _raise_on_implicit_loads)
+            try:
+                yield session
+            finally:
+                await session.close()
+                await transaction.rollback()
     finally:
         await engine.dispose()
+
+
+_TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+@contextmanager
+def _count_queries(engine: AsyncEngine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def _record(conn, cursor, statement, parameters, context, executemany):
+        # Transaction bookkeeping (incl. the db_session SAVEPOINTs) is not query work.
+        if not statement.lstrip().upper().startswith(_TRANSACTION_CONTROL):
+            statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", _record)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", _record)
+
+
+@pytest.fixture
+def count_queries() -> Callable[[AsyncEngine], AbstractContextManager[list[str]]]:
+    """Collect the SQL statements executed on an engine inside a ``with`` block."""
+    return _count_queries
@@ -1,15 +1,15 @@
+import asyncio
 from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
-import pytest
 from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.models.monitors import MetricSnapshot, MonitoredBackend
 from backend.app.schemas.telegram import WarnThresholds
 from backend.app.services import telegram_settings, warnings
 
 
-@pytest.mark.asyncio
 async def test_get_or_create_settings_persists_defaults(db_session, monkeypatch):
     monkeypatch.setattr(
         telegram_settings,
@@ -29,14 +29,90 @@ async def test_get_or_create_settings_persists_defaults(db_session, monkeypatch)
     same_row = await telegram_settings.get_or_create_settings(db_session)
     assert same_row.id == row.id
 
-    row.warn_thresholds = {"cpu_temperature_c": 91}
+    editable = await telegram_settings.get_or_create_settings(db_session, use_cache=False)
+    editable.warn_thresholds = {"cpu_temperature_c": 91}
     await db_session.commit()
+    telegram_settings.invalidate_settings_cache()
 
     thresholds = await telegram_settings.get_warn_thresholds(db_session)
     assert thresholds is not None
     assert thresholds.cpu_temperature_c == 91
 
 
+async def test_get_or_create_settings_serves_cached_row(db_session, monkeypatch):
+    row = await telegram_settings.get_or_create_settings(db_session)
+
+    async def fail_load(session):
+        raise AssertionError("settings should come from the cache")
+
+    monkeypatch.setattr(telegram_settings, "_load_or_create_settings", fail_load)
+    assert await telegram_settings.get_or_create_settings(db_session) is row
+
+    monkeypatch.undo()
+    telegram_settings.invalidate_settings_cache()
+    reloaded = await telegram_settings.get_or_create_settings(db_session)
+    assert reloaded.id == row.id
+
+
+async def test_invalidation_during_load_prevents_stale_fill(db_session, monkeypatch):
+    telegram_settings.invalidate_settings_cache()
+    real_load = telegram_settings._load_or_create_settings
+    loading = asyncio.Event()
+    release = asyncio.Event()
+
+    async def slow_load(session):
+        row = await real_load(session)
+        loading.set()
+        await release.wait()
+        return row
+
+    monkeypatch.setattr(telegram_settings, "_load_or_create_settings", slow_load)
+    reader = asyncio.create_task(telegram_settings.get_or_create_settings(db_session))
+    await loading.wait()
+    # A settings update commits and invalidates while the reader's query is in flight.
+    telegram_settings.invalidate_settings_cache()
+    release.set()
+    await reader
+
+    assert telegram_settings._SETTINGS_CACHE["row"] is None
+
+
+async def test_cached_settings_survive_loading_session_rollback(db_session):
+    row = await telegram_settings.get_or_create_settings(db_session)
+    await db_session.rollback()
+    await db_session.close()
+
+    other = AsyncSession(bind=db_session.bind, join_transaction_mode="create_savepoint")
+    try:
+        cached = await telegram_settings.get_or_create_settings(other)
+        assert cached is row
+        # Plain attribute reads must not need a lazy load through either session.
+        assert cached.bot_token == row.bot_token
+        assert cached.is_active == row.is_active
+    finally:
+        await other.close()
+
+
+async def test_get_warn_thresholds_reuses_parsed_model(db_session):
+    row = await telegram_settings.get_or_create_settings(db_session, use_cache=False)
+    row.warn_thresholds = {"ram_used_percent": 70}
+    await db_session.commit()
+    telegram_settings.invalidate_settings_cache()
+
+    first = await telegram_settings.get_warn_thresholds(db_session)
+    second = await telegram_settings.get_warn_thresholds(db_session)
+    assert first is second
+    assert first.ram_used_percent == 70
+
+    row.warn_thresholds = {"ram_used_percent": 75}
+    await db_session.commit()
+    telegram_settings.invalidate_settings_cache()
+
+    updated = await telegram_settings.get_warn_thresholds(db_session)
+    assert updated is not first
+    assert updated.ram_used_percent == 75
+
+
 def _snapshot(
     backend_id: int,
     reported_at: datetime,
@@ -60,8 +136,7 @@ def _snapshot(
     return MetricSnapshot(**base)
 
 
-@pytest.mark.asyncio
-async def test_recalculate_latest_snapshot_warnings_updates_models(db_session):
+async def test_recalculate_latest_snapshot_warnings_updates_models(db_session, count_queries):
     now = datetime.now(tz=timezone.utc)
     backend_one = MonitoredBackend(
         name="alpha",
@@ -115,7 +190,10 @@ async def test_recalculate_latest_snapshot_warnings_updates_models(db_session):
         mounted_usage_percent=90.0,
     )
 
-    await warnings.recalculate_latest_snapshot_warnings(db_session, thresholds)
+    # One SELECT plus one bulk UPDATE per table, regardless of how many backends there are.
+    with count_queries(db_session.bind.engine) as statements:
+        await warnings.recalculate_latest_snapshot_warnings(db_session, thresholds)
+    assert len(statements) <= 3
 
     latest_snapshots = await db_session.execute(
         select(MetricSnapshot).where(MetricSnapshot.backend_id.in_([backend_one.id, backend_two.id]))
@@ -0,0 +1,97 @@
+import os
+import shutil
+import subprocess
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from sqlalchemy import select
+
+from backend.app.models.monitors import RebootEvent
+from backend.app.services import reboot_service
+from backend.app.services.telegram_service import TelegramError
+
+
+async def _add_events(db_session, *names: str) -> list[RebootEvent]:
+    events = [
+        RebootEvent(requested_by=name, chat_id="42", created_at=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        for name in names
+    ]
+    db_session.add_all(events)
+    await db_session.commit()
+    return events
+
+
+async def _notified(db_session) -> dict[str, bool]:
+    result = await db_session.execute(select(RebootEvent.requested_by, RebootEvent.back_notified_at))
+    return {name: notified_at is not None for name, notified_at in result}
+
+
+def _patch_sends(monkeypatch, outcomes: dict[str, BaseException | None]) -> None:
+    async def fake_context(session, chat_id, strict=False):
+        return SimpleNamespace(bot_token="token"), "42"
+
+    async def fake_send(bot_token, chat_id, text):
+        requested_by = text.split("requested by ", 1)[1].split(" at ", 1)[0]
+        error = outcomes[requested_by]
+        if error is not None:
+            raise error
+
+    monkeypatch.setattr(reboot_service, "resolve_message_context", fake_context)
+    monkeypatch.setattr(reboot_service, "send_message", fake_send)
+
+
+async def test_notify_reboot_recovery_skips_failed_sends(db_session, monkeypatch):
+    await _add_events(db_session, "ok", "telegram", "transport")
+    _patch_sends(
+        monkeypatch,
+        {
+            "ok": None,
+            "telegram": TelegramError("bad request"),
+            "transport": httpx.ConnectError("connection refused"),
+        },
+    )
+
+    await reboot_service.notify_reboot_recovery(db_session)
+
+    assert await _notified(db_session) == {"ok": True, "telegram": False, "transport": False}
+
+
+async def test_notify_reboot_recovery_persists_delivered_before_raising(db_session, monkeypatch):
+    await _add_events(db_session, "ok", "broken")
+    _patch_sends(monkeypatch, {"ok": None, "broken": ValueError("invalid JSON")})
+
+    with pytest.raises(ValueError):
+        await reboot_service.notify_reboot_recovery(db_session)
+
+    assert await _notified(db_session) == {"ok": True, "broken": False}
+
+
+requires_posix_spawn = pytest.mark.skipif(not hasattr(os, "posix_spawn"), reason="posix_spawn unavailable")
+
+
+@requires_posix_spawn
+@pytest.mark.parametrize(("command", "expected"), [("true", 0), ("false", 1)])
+async def test_spawn_and_wait_returns_exit_code(command, expected):
+    assert await reboot_service._spawn_and_wait([shutil.which(command)]) == expected
+
+
+@requires_posix_spawn
+async def test_spawn_and_wait_kills_and_reaps_on_timeout(monkeypatch):
+    spawned: list[int] = []
+    real_spawn = os.posix_spawn
+
+    def tracking_spawn(path, argv, env):
+        pid = real_spawn(path, argv, env)
+        spawned.append(pid)
+        return pid
+
+    monkeypatch.setattr(reboot_service.os, "posix_spawn", tracking_spawn)
+
+    with pytest.raises(subprocess.TimeoutExpired):
+        await reboot_service._spawn_and_wait([shutil.which("sleep"), "5"], timeout=0.1)
+
+    # The child was waited on already, so there is nothing left to reap.
+    with pytest.raises(ChildProcessError):
+        os.waitpid(spawned[0], os.WNOHANG)
@@ -0,0 +1,76 @@
+import asyncio
+
+import pytest
+from fastapi import HTTPException
+
+from backend.app.services import telegram_notifications, telegram_settings
+
+
+async def _configure_settings(db_session, *, is_active: bool) -> None:
+    row = await telegram_settings.get_or_create_settings(db_session, use_cache=False)
+    row.bot_token = "token"
+    row.default_chat_id = "42"
+    row.is_active = is_active
+    await db_session.commit()
+    telegram_settings.invalidate_settings_cache()
+
+
+async def test_send_compiled_message_sends_built_text(db_session, monkeypatch):
+    await _configure_settings(db_session, is_active=True)
+    sent = []
+
+    async def fake_fetch(session, *, backend_id=None, backend_name=None):
+        return ["alpha", "bravo"]
+
+    async def fake_send(bot_token, chat_id, text):
+        sent.append((bot_token, chat_id, text))
+
+    monkeypatch.setattr(telegram_notifications, "_fetch_backends_in_sibling_session", fake_fetch)
+    monkeypatch.setattr(telegram_notifications, "send_message", fake_send)
+
+    text = await telegram_notifications.send_compiled_message(db_session, lambda backends: ", ".join(backends))
+
+    assert text == "alpha, bravo"
+    assert sent == [("token", "42", "alpha, bravo")]
+
+
+async def test_send_compiled_message_not_found_for_filtered_lookup(db_session, monkeypatch):
+    await _configure_settings(db_session, is_active=True)
+
+    async def fake_fetch(session, *, backend_id=None, backend_name=None):
+        return []
+
+    monkeypatch.setattr(telegram_notifications, "_fetch_backends_in_sibling_session", fake_fetch)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await telegram_notifications.send_compiled_message(db_session, str, backend_name="missing")
+    assert exc_info.value.status_code == 404
+
+
+async def test_send_compiled_message_disabled_cancels_backend_fetch(db_session, monkeypatch):
+    await _configure_settings(db_session, is_active=False)
+    started = asyncio.Event()
+    cancelled = asyncio.Event()
+
+    async def slow_fetch(session, *, backend_id=None, backend_name=None):
+        started.set()
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    async def fail_send(*args, **kwargs):
+        pytest.fail("nothing should be sent while the integration is disabled")
+
+    monkeypatch.setattr(telegram_notifications, "_fetch_backends_in_sibling_session", slow_fetch)
+    monkeypatch.setattr(telegram_notifications, "send_message", fail_send)
+
+    with pytest.raises(HTTPException) as exc_info:
+        await telegram_notifications.send_compiled_message(db_session, str)
+
+    assert exc_info.value.status_code == 400
+    assert exc_info.value.detail == "Telegram integration disabled"
+    # The lookup was stopped before the error propagated, not left running.
+    assert started.is_set() and cancelled.is_set()
@@ -1,7 +1,6 @@
-from types import SimpleNamespace
-
 import pytest
 
+from backend.app.core.config import Settings
 from backend.app.routers import telegram
 
 
@@ -26,7 +25,7 @@ def test_extract_command_variants(message, expected):
 
 
 def test_is_authorized_user_defaults_to_true(monkeypatch):
-    monkeypatch.setattr(telegram, "settings", SimpleNamespace(telegram_allowed_users=[]), raising=False)
+    monkeypatch.setattr(telegram, "settings", Settings(telegram_allowed_users=[]), raising=False)
     assert telegram._is_authorized_user({"from": {"id": 123}})
 
 
@@ -34,7 +33,7 @@ def test_is_authorized_user_checks_ids_and_usernames(monkeypatch):
     monkeypatch.setattr(
         telegram,
         "settings",
-        SimpleNamespace(telegram_allowed_users=["12345", "FriendlyUser"]),
+        Settings(telegram_allowed_users=["12345", "FriendlyUser"]),
         raising=False,
     )
 
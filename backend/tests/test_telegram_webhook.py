@@ -1,5 +1,3 @@
-import pytest
-
 from backend.app.routers.telegram import telegram_webhook, TelegramUpdate
 
 
@@ -7,7 +5,6 @@ class DummySession:
     pass
 
 
-@pytest.mark.asyncio
 async def test_telegram_webhook_stats_triggers_notification(monkeypatch):
     monkeypatch.setattr("backend.app.routers.telegram._is_authorized_user", lambda message: True)
 
@@ -31,7 +28,6 @@ async def test_telegram_webhook_stats_triggers_notification(monkeypatch):
     assert captured["stats"][1] == "222"
 
 
-@pytest.mark.asyncio
 async def test_telegram_webhook_warn_triggers_notification(monkeypatch):
     monkeypatch.setattr("backend.app.routers.telegram._is_authorized_user", lambda message: True)
 
@@ -55,7 +51,6 @@ async def test_telegram_webhook_warn_triggers_notification(monkeypatch):
     assert captured["warn"][1] == "333"
 
 
-@pytest.mark.asyncio
 async def test_telegram_webhook_unauthorized(monkeypatch):
     captured = {}
 
@@ -0,0 +1,52 @@
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from backend.app.routers import telegram
+from backend.app.routers.telegram import telegram_webhook, TelegramUpdate
+
+
+class DummySession:
+    pass
+
+
+@pytest.fixture
+def telegram_mod(monkeypatch):
+    monkeypatch.setattr(telegram, "send_stats_message", AsyncMock(return_value="ok"))
+    monkeypatch.setattr(telegram, "send_warn_message", AsyncMock(return_value="warn"))
+    monkeypatch.setattr(telegram, "send_message", AsyncMock())
+    monkeypatch.setattr(
+        telegram,
+        "get_or_create_settings",
+        AsyncMock(return_value=SimpleNamespace(bot_token="token")),
+    )
+    # Authorization depends on the sender only, so concurrent updates cannot race on it.
+    monkeypatch.setattr(
+        telegram,
+        "_is_authorized_user",
+        lambda message: (message.get("from") or {}).get("id") == 1,
+    )
+    return telegram
+
+
+async def test_concurrent_webhook_updates(telegram_mod):
+    update_stats = TelegramUpdate(message={"text": "/stats", "from": {"id": 1}, "chat": {"id": 100}})
+    update_warn = TelegramUpdate(message={"text": "/warn", "from": {"id": 1}, "chat": {"id": 200}})
+    update_unauthorized = TelegramUpdate(message={"text": "/stats", "from": {"id": 2}, "chat": {"id": 300}})
+
+    responses = await asyncio.gather(
+        telegram_webhook(update_stats, session=DummySession()),
+        telegram_webhook(update_warn, session=DummySession()),
+        telegram_webhook(update_unauthorized, session=DummySession()),
+    )
+
+    assert responses == [{"ok": True}, {"ok": True}, {"ok": False, "error": "unauthorized"}]
+    assert telegram_mod.send_stats_message.await_args.kwargs["chat_id"] == "100"
+    assert telegram_mod.send_warn_message.await_args.kwargs["chat_id"] == "200"
+    telegram_mod.send_message.assert_awaited_once_with(
+        "token",
+        "300",
+        "You are not authorized to use this bot.",
+    )
@@ -1,12 +1,19 @@
 from functools import lru_cache
-import json
+import re
 from datetime import timedelta
-from typing import Any, List
+from typing import Any, Iterable, List
 
+import orjson
 from pydantic import Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+# Separators swallow surrounding whitespace and quotes so one split yields clean tokens;
+# spaces and brackets inside a path are kept.
+_MOUNT_EDGE_CHARS = " \t\r\n\"'"
+_MOUNT_SPLIT_RE = re.compile(r"[\s\"']*,[\s\"']*")
+
+
 def _safe_json_loads(value: Any) -> Any:
     if isinstance(value, (bytes, bytearray)):
         value = value.decode()
@@ -15,12 +22,21 @@ def _safe_json_loads(value: Any) -> Any:
         if not stripped:
             return stripped
         try:
-            return json.loads(stripped)
-        except json.JSONDecodeError:
+            return orjson.loads(stripped)
+        except orjson.JSONDecodeError:
             return value
     return value
 
 
+def _normalize_mount_tokens(tokens: Iterable[str]) -> List[str]:
+    normalized = [
+        "auto" if token.lower() == "auto" or token == "*" else token
+        for token in tokens
+        if token
+    ]
+    return normalized or ["auto"]
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_file=".env",
@@ -45,45 +61,24 @@ class Settings(BaseSettings):
     @field_validator("mounted_points", mode="before")
     @classmethod
     def _parse_mounts(cls, value: List[str] | str) -> List[str]:
-        def _normalize_list(items: List[str]) -> List[str]:
-            normalized: List[str] = []
-            for item in items:
-                token = str(item).strip()
-                if not token:
-                    continue
-                if token.lower() == "auto" or token == "*":
-                    normalized.append("auto")
-                else:
-                    normalized.append(token)
-            return normalized
-
         if isinstance(value, list):
-            mounts = [
-                mount
-                for mount in value
-                if isinstance(mount, (str, int, float)) and str(mount).strip()
-            ]
-            normalized = _normalize_list([str(mount) for mount in mounts])
-            return normalized or ["auto"]
+            return _normalize_mount_tokens(
+                str(mount).strip() for mount in value if isinstance(mount, (str, int, float))
+            )
         if isinstance(value, str):
             stripped = value.strip()
             if stripped:
                 if stripped.startswith("["):
                     try:
-                        parsed = json.loads(stripped)
-                    except json.JSONDecodeError:
+                        parsed = orjson.loads(stripped)
+                    except orjson.JSONDecodeError:
                         parsed = None
                     else:
                         if isinstance(parsed, list):
-                            normalized = _normalize_list(parsed)
-                            return normalized or ["auto"]
-                mounts = [
-                    item.strip().strip('"').strip("'")
-                    for item in value.split(",")
-                    if item and item.strip().strip('"').strip("'")
-                ]
-                normalized = _normalize_list(mounts)
-                return normalized or ["auto"]
+                            return _normalize_mount_tokens(str(item).strip() for item in parsed)
+                    # Malformed JSON list: drop only its outer brackets before splitting.
+                    stripped = stripped[1:-1] if stripped.endswith("]") else stripped[1:]
+                return _normalize_mount_tokens(_MOUNT_SPLIT_RE.split(stripped.strip(_MOUNT_EDGE_CHARS)))
         return ["auto"]
 
     @field_validator("host_root_target", mode="before")
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from contextlib import asynccontextmanager
 
-from fastapi import Depends, FastAPI, Header, HTTPException, status
+from fastapi import Depends, FastAPI, Header, HTTPException, Query, status
+from fastapi.responses import ORJSONResponse
 
 from monitor.app import metrics
 from monitor.app.config import settings
@@ -18,6 +19,14 @@ async def verify_token(authorization: str | None = Header(None)) -> None:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid token")
 
 
+def _collect_payload(include_raw: bool = False) -> MetricPayload:
+    # The collector returns plain dicts and an ISO timestamp, so this is the one validation pass;
+    # the envelope around the resulting model is built with model_construct.
+    raw = metrics.collect_metrics()
+    # raw_payload repeats every typed field, so it is only attached on request.
+    return MetricPayload.model_validate({**raw, "raw_payload": raw if include_raw else None})
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     await repository.initialize()
@@ -26,18 +35,27 @@ async def lifespan(app: FastAPI):
 
 
 def create_app() -> FastAPI:
-    application = FastAPI(title=settings.app_name, debug=settings.debug, lifespan=lifespan)
+    application = FastAPI(
+        title=settings.app_name,
+        debug=settings.debug,
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
+    )
 
     @application.get("/healthz", tags=["meta"])
     async def health() -> dict[str, str]:  # pragma: no cover - simple endpoint
         return {"status": "ok"}
 
-    @application.get("/metrics", response_model=MetricResponse, dependencies=[Depends(verify_token)])
-    async def get_metrics() -> MetricResponse:
-        raw = metrics.collect_metrics()
-        payload = MetricPayload.model_validate({**raw, "raw_payload": raw})
+    @application.get(
+        "/metrics",
+        response_model=MetricResponse,
+        response_model_exclude_none=True,
+        dependencies=[Depends(verify_token)],
+    )
+    async def get_metrics(include_raw: bool = Query(False)) -> MetricResponse:
+        payload = _collect_payload(include_raw)
         await repository.record(payload)
-        return MetricResponse(metrics=payload)
+        return MetricResponse.model_construct(metrics=payload)
 
     @application.post("/reboot", status_code=status.HTTP_202_ACCEPTED, dependencies=[Depends(verify_token)])
     async def reboot_host() -> dict[str, str]:
@@ -49,14 +67,17 @@ def create_app() -> FastAPI:
         except RuntimeError as exc:
             raise HTTPException(status_code=status.HTTP_502_BAD_GATEWAY, detail=str(exc)) from exc
 
-    @application.get("/metrics/latest", response_model=MetricResponse, dependencies=[Depends(verify_token)])
+    @application.get(
+        "/metrics/latest",
+        response_model=MetricResponse,
+        response_model_exclude_none=True,
+        dependencies=[Depends(verify_token)],
+    )
     async def latest_metrics() -> MetricResponse:
         latest = await repository.latest()
         if not latest:
-            raw = metrics.collect_metrics()
-            payload = MetricPayload.model_validate({**raw, "raw_payload": raw})
-            return MetricResponse(metrics=payload)
-        return MetricResponse(metrics=latest)
+            return MetricResponse.model_construct(metrics=_collect_payload())
+        return MetricResponse.model_construct(metrics=latest)
 
     return application
 
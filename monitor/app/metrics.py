@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from functools import lru_cache
 import os
 import platform
+import re
 import socket
+import sys
 import time
 from datetime import datetime, timezone
 from typing import Any
@@ -20,15 +23,37 @@ from monitor.app.config import settings
 CPU_TEMP_WARN = 80.0
 RAM_WARN_PERCENT = 90.0
 DISK_WARN_PERCENT = 90.0
+MOUNTS_CACHE_TTL_SECONDS = 30.0
+MOUNTINFO_PATH = "/proc/self/mountinfo"
+
+# (payload key, threshold, message template) checked in order by _detect_warnings.
+_WARNING_RULES = (
+    ("cpu_temperature_c", CPU_TEMP_WARN, "High CPU temperature {:.1f}°C"),
+    ("ram_used_percent", RAM_WARN_PERCENT, "High RAM usage {:.1f}%"),
+    ("disk_usage_percent", DISK_WARN_PERCENT, "Disk usage critical at {:.1f}%"),
+)
 
 logger = logging.getLogger(__name__)
 
+# Mount topology rarely changes, so discovery results are reused for a short while.
+_MOUNTS_CACHE: dict[str, Any] = {"ts": 0.0, "key": None, "value": None}
+# Fallback path that answered disk_usage() when the preferred (host) candidate failed, keyed by
+# (mount, host root target). Kept only for MOUNTS_CACHE_TTL_SECONDS so the preferred path is
+# retried regularly and a transient failure cannot pin the container-local path.
+_USAGE_PATHS: dict[tuple[str, str | None], tuple[str, float]] = {}
+_MOUNTINFO_ESCAPE_RE = re.compile(r"\\([0-7]{3})")
+
 
-def _get_cpu_temperature() -> float | None:
+def _read_temperatures() -> dict[str, list[Any]]:
     try:
-        temps = psutil.sensors_temperatures()
+        return psutil.sensors_temperatures() or {}
     except (AttributeError, NotImplementedError):
-        return None
+        return {}
+
+
+def _get_cpu_temperature(temps: dict[str, list[Any]] | None = None) -> float | None:
+    if temps is None:
+        temps = _read_temperatures()
     if not temps:
         return None
     # Try common sensor labels
@@ -56,9 +81,15 @@ def _normalize_mount_path(path: str) -> str:
 
 
 def _configured_mount_points() -> tuple[list[str], bool]:
+    configured, auto = _parse_configured_mounts(tuple(settings.mounted_points))
+    return list(configured), auto
+
+
+@lru_cache(maxsize=8)
+def _parse_configured_mounts(entries: tuple[str, ...]) -> tuple[tuple[str, ...], bool]:
     configured: list[str] = []
     auto = False
-    for entry in settings.mounted_points:
+    for entry in entries:
         token = str(entry).strip()
         if not token:
             continue
@@ -66,18 +97,49 @@ def _configured_mount_points() -> tuple[list[str], bool]:
             auto = True
             continue
         configured.append(_normalize_mount_path(token))
-    return configured, auto
+    return tuple(configured), auto
 
 
 def _discover_mount_points() -> list[str]:
-    mounts: list[str] = []
     host_target = _normalize_mount_path(settings.host_root_target) if settings.host_root_target else ""
+    now = time.monotonic()
+    cached = _MOUNTS_CACHE["value"]
+    if (
+        cached is not None
+        and _MOUNTS_CACHE["key"] == host_target
+        and now - _MOUNTS_CACHE["ts"] < MOUNTS_CACHE_TTL_SECONDS
+    ):
+        return list(cached)
+    mounts = _scan_mount_points(host_target)
+    _MOUNTS_CACHE.update(ts=now, key=host_target, value=mounts)
+    return list(mounts)
+
+
+def _list_mountpoints() -> list[str]:
+    # Only the mount point is needed, so on Linux read it straight from mountinfo
+    # (field 5, with spaces and friends octal-escaped) instead of building psutil partitions.
+    if sys.platform.startswith("linux"):
+        try:
+            with open(MOUNTINFO_PATH, encoding="utf-8", errors="replace") as handle:
+                return [_unescape_mountinfo(fields[4]) for fields in map(str.split, handle) if len(fields) > 4]
+        except OSError:
+            pass
     try:
         partitions = psutil.disk_partitions(all=True)
     except Exception:
-        partitions = []
-    for partition in partitions:
-        mount = getattr(partition, "mountpoint", "")
+        return []
+    return [getattr(partition, "mountpoint", "") for partition in partitions]
+
+
+def _unescape_mountinfo(value: str) -> str:
+    if "\\" not in value:
+        return value
+    return _MOUNTINFO_ESCAPE_RE.sub(lambda match: chr(int(match.group(1), 8)), value)
+
+
+def _scan_mount_points(host_target: str) -> list[str]:
+    mounts: list[str] = []
+    for mount in _list_mountpoints():
         mount = _normalize_mount_path(mount)
         if not mount:
             continue
@@ -143,8 +205,14 @@ def _mounted_usage(mount_points: list[str]) -> list[dict[str, Any]]:
 
 
 def _candidate_paths_for_mount(mount: str) -> list[str]:
+    return list(_candidate_paths(mount, settings.host_root_target))
+
+
+# Keyed on the host root target too, so a settings change never serves stale paths.
+@lru_cache(maxsize=64)
+def _candidate_paths(mount: str, host_root_target: str | None) -> tuple[str, ...]:
     candidates: list[str] = []
-    host_target = _normalize_mount_path(settings.host_root_target) if settings.host_root_target else ""
+    host_target = _normalize_mount_path(host_root_target) if host_root_target else ""
     normalized_mount = _normalize_mount_path(mount)
     if host_target and host_target != "/":
         if normalized_mount == "/":
@@ -154,34 +222,42 @@ def _candidate_paths_for_mount(mount: str) -> list[str]:
             candidate = os.path.join(host_target, suffix) if suffix else host_target
             candidates.append(_normalize_mount_path(candidate))
     candidates.append(normalized_mount)
-    return candidates
+    return tuple(candidates)
 
 
 def _get_disk_usage(mount: str):
-    for candidate in _candidate_paths_for_mount(mount):
+    key = (mount, settings.host_root_target)
+    candidates = _candidate_paths(*key)
+    fallback = _USAGE_PATHS.get(key)
+    if fallback is not None:
+        path, ts = fallback
+        if time.monotonic() - ts < MOUNTS_CACHE_TTL_SECONDS:
+            try:
+                return psutil.disk_usage(path)
+            except OSError:
+                pass
+        _USAGE_PATHS.pop(key, None)
+    for index, candidate in enumerate(candidates):
         try:
-            return psutil.disk_usage(candidate)
+            stats = psutil.disk_usage(candidate)
         except (FileNotFoundError, PermissionError, OSError):
             continue
+        if index:
+            _USAGE_PATHS[key] = (candidate, time.monotonic())
+        return stats
     return None
 
 
 def _detect_warnings(payload: dict[str, Any]) -> list[str]:
     warnings: list[str] = []
-    temp = payload.get("cpu_temperature_c")
-    if isinstance(temp, (int, float)) and temp >= CPU_TEMP_WARN:
-        warnings.append(f"High CPU temperature {temp:.1f}°C")
-    ram_percent = payload.get("ram_used_percent")
-    if isinstance(ram_percent, (int, float)) and ram_percent >= RAM_WARN_PERCENT:
-        warnings.append(f"High RAM usage {ram_percent:.1f}%")
-    disk_percent = payload.get("disk_usage_percent")
-    if isinstance(disk_percent, (int, float)) and disk_percent >= DISK_WARN_PERCENT:
-        warnings.append(f"Disk usage critical at {disk_percent:.1f}%")
+    for key, threshold, template in _WARNING_RULES:
+        value = payload.get(key)
+        if isinstance(value, (int, float)) and value >= threshold:
+            warnings.append(template.format(value))
     for volume in payload.get("mounted_usage") or []:
         percent = volume.get("used_percent")
-        mount = volume.get("mount_point")
         if isinstance(percent, (int, float)) and percent >= DISK_WARN_PERCENT:
-            warnings.append(f"{mount} usage critical at {percent:.1f}%")
+            warnings.append(f"{volume.get('mount_point')} usage critical at {percent:.1f}%")
     return warnings
 
 
@@ -196,7 +272,9 @@ def collect_metrics() -> dict[str, Any]:
     except (AttributeError, OSError):
         pass
 
-    cpu_temp = _get_cpu_temperature()
+    # sensors_temperatures() walks /sys/class/hwmon, so read it once for CPU and disk temperatures.
+    temps = _read_temperatures()
+    cpu_temp = _get_cpu_temperature(temps)
     try:
         net_io = psutil.net_io_counters(pernic=True)
     except Exception:
@@ -207,16 +285,12 @@ def collect_metrics() -> dict[str, Any]:
     ] if net_io else None
 
     disk_temps: list[dict[str, Any]] | None = None
-    try:
-        temps = psutil.sensors_temperatures()
-        if temps:
-            disk_temps = []
-            for name, entries in temps.items():
-                for entry in entries:
-                    label = entry.label or name
-                    disk_temps.append({"device": label, "temperature_c": getattr(entry, "current", None)})
-    except (AttributeError, NotImplementedError):
-        disk_temps = None
+    if temps:
+        disk_temps = []
+        for name, entries in temps.items():
+            for entry in entries:
+                label = entry.label or name
+                disk_temps.append({"device": label, "temperature_c": getattr(entry, "current", None)})
 
     mount_points = _resolve_mount_points()
     payload: dict[str, Any] = {
@@ -1,22 +1,46 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, field_validator
 
 
 class MountedVolume(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     mount_point: str
     total_gb: float | None = Field(None, ge=0)
     used_percent: float | None = Field(None, ge=0, le=100)
 
 
 class CPULoad(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     one: float | None = None
     five: float | None = None
     fifteen: float | None = None
 
 
+class NetworkCounter(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    interface: str
+    bytes_sent: int | None = None
+    bytes_recv: int | None = None
+
+
+class DiskTemperature(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+    device: str
+    temperature_c: float | None = None
+
+
 class MetricPayload(BaseModel):
+    # Snapshots are shared by reference between the collector, the repository and responses,
+    # so fields are frozen and collections are tuples of frozen models. raw_payload is the one
+    # exception: it is an opt-in, free-form echo of the collector output and stays a plain dict.
+    model_config = ConfigDict(frozen=True, extra="ignore")
+
     reported_at: datetime
     hostname: str | None = None
     backend_version: str | None = None
@@ -24,16 +48,24 @@ class MetricPayload(BaseModel):
     ram_used_percent: float | None = None
     total_ram_gb: float | None = None
     disk_usage_percent: float | None = None
-    mounted_usage: list[MountedVolume] | None = None
+    mounted_usage: tuple[MountedVolume, ...] | None = None
     cpu_load: CPULoad | None = None
-    network_counters: list[dict] | None = None
-    disk_temperatures: list[dict] | None = None
+    network_counters: tuple[NetworkCounter, ...] | None = None
+    disk_temperatures: tuple[DiskTemperature, ...] | None = None
     os_version: str | None = None
     uptime_seconds: int | None = None
-    warnings: list[str] | None = None
-    configured_mounts: list[str] | None = None
+    warnings: tuple[str, ...] | None = None
+    configured_mounts: tuple[str, ...] | None = None
     raw_payload: dict[str, Any] | None = None
 
+    @field_validator("reported_at", mode="after")
+    @classmethod
+    def _normalize_reported_at(cls, value: datetime) -> datetime:
+        # Normalized once at the boundary so consumers can treat it as aware UTC; naive is UTC.
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
+
 
 class MetricResponse(BaseModel):
     metrics: MetricPayload
@@ -1,27 +1,35 @@
 from __future__ import annotations
 
-import asyncio
-from collections import deque
-from datetime import datetime, timezone
-from typing import Deque
+from array import array
+from bisect import bisect_left
+from datetime import timedelta
+from time import monotonic
+from typing import Iterable
 
 from monitor.app.config import settings
 from monitor.app.schemas import MetricPayload
 
 
-def _normalize_timestamp(value: datetime) -> datetime:
-    if value.tzinfo is None:
-        return value.replace(tzinfo=timezone.utc)
-    return value.astimezone(timezone.utc)
-
-
 class MetricsRepository:
-    """Lightweight in-memory storage for recent metric snapshots."""
+    """Lightweight in-memory storage for recent metric snapshots.
+
+    All access happens on the application's event loop and no method awaits while
+    touching the buffers, so there is nothing to guard with a lock.
+    """
 
     def __init__(self, max_entries: int) -> None:
-        self._max_entries = max_entries
-        self._lock = asyncio.Lock()
-        self._items: Deque[MetricPayload] = deque()
+        # Fixed-capacity ring buffer: snapshots and the monotonic time they were recorded at sit in
+        # parallel preallocated slots, so any position is one index away and pruning only reads
+        # floats. Monotonic stamps never go backwards, which keeps the timestamp run sorted.
+        # A capacity of zero (or less) retains nothing, so latest() always returns None.
+        self._capacity = max(0, max_entries)
+        self._items: list[MetricPayload | None] = [None] * self._capacity
+        self._timestamps = array("d", [0.0]) * self._capacity
+        self._head = 0
+        self._size = 0
+        # Newest retained snapshot, so latest() is a single attribute read.
+        self._latest_ref: MetricPayload | None = None
+        self._retention_seconds = settings.history_retention().total_seconds()
 
     async def initialize(self) -> None:
         # Initialization kept for API symmetry; nothing to load yet.
@@ -32,27 +40,69 @@ class MetricsRepository:
         return
 
     async def record(self, payload: MetricPayload) -> None:
-        snapshot = payload.model_copy(deep=True)
-        async with self._lock:
-            self._items.append(snapshot)
-            self._prune_locked()
+        self._append(payload, monotonic())
+        self._prune_expired()
+
+    async def record_batch(self, payloads: Iterable[MetricPayload]) -> None:
+        """Record several snapshots in order, pruning once at the end."""
+        recorded_at = monotonic()
+        for payload in payloads:
+            self._append(payload, recorded_at)
+        self._prune_expired()
 
     async def latest(self) -> MetricPayload | None:
-        async with self._lock:
-            if not self._items:
-                return None
-            return self._items[-1].model_copy(deep=True)
+        return self._latest_ref
 
     async def prune(self) -> None:
-        async with self._lock:
-            self._prune_locked()
-
-    def _prune_locked(self) -> None:
-        retention_cutoff = _normalize_timestamp(datetime.now(tz=timezone.utc)) - settings.history_retention()
-        while self._items and _normalize_timestamp(self._items[0].reported_at) < retention_cutoff:
-            self._items.popleft()
-        while len(self._items) > self._max_entries:
-            self._items.popleft()
+        self._prune_expired()
+
+    def set_retention(self, retention: timedelta) -> None:
+        """Replace the retention window captured from settings at construction time."""
+        self._retention_seconds = retention.total_seconds()
+
+    def _append(self, payload: MetricPayload, recorded_at: float) -> None:
+        if not self._capacity:
+            return
+        # MetricPayload is frozen, so the stored snapshot can be shared without a defensive copy.
+        slot = (self._head + self._size) % self._capacity
+        self._items[slot] = payload
+        self._timestamps[slot] = recorded_at
+        self._latest_ref = payload
+        if self._size == self._capacity:
+            # The buffer was full, so the write above replaced the oldest snapshot. It is dropped
+            # rather than recycled: payloads are shared by reference and may still be in use.
+            self._head = (self._head + 1) % self._capacity
+        else:
+            self._size += 1
+
+    def _snapshot_at(self, index: int) -> MetricPayload | None:
+        # Logical index, 0 being the oldest retained snapshot.
+        return self._items[(self._head + index) % self._capacity]
+
+    def _prune_expired(self) -> None:
+        # Retention is measured on the monotonic clock, so wall-clock jumps never expire snapshots
+        # early or keep them too long; reported_at is left for clients.
+        cutoff = monotonic() - self._retention_seconds
+        timestamps, head, size = self._timestamps, self._head, self._size
+        # The oldest snapshot is at the head, so a fresh head means nothing is expired.
+        if not size or timestamps[head] >= cutoff:
+            return
+        # Otherwise binary-search the expired run across the (at most two) contiguous
+        # segments of the ring, release those slots by slice and bump the head once.
+        items, capacity = self._items, self._capacity
+        end = head + size
+        first_end = min(end, capacity)
+        first = bisect_left(timestamps, cutoff, head, first_end) - head
+        second = 0
+        if head + first == first_end and end > capacity:
+            second = bisect_left(timestamps, cutoff, 0, end - capacity)
+        items[head:head + first] = [None] * first
+        items[:second] = [None] * second
+        expired = first + second
+        self._head = (head + expired) % capacity
+        self._size = size - expired
+        if not self._size:
+            self._latest_ref = None
 
 
 repository = MetricsRepository(settings.history_max_entries)
@@ -0,0 +1,27 @@
+import pytest
+
+from monitor.app.config import Settings
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ('["/", "/data"]', ["/", "/data"]),
+        ("/, /data", ["/", "/data"]),
+        ("\"/a\", '/b'", ["/a", "/b"]),
+        ("*,/x", ["auto", "/x"]),
+        (" /mnt/x ,, ", ["/mnt/x"]),
+        ("/mnt/my disk, /data", ["/mnt/my disk", "/data"]),
+        ('["/a", "/b"', ["/a", "/b"]),
+        ("/mnt/disk[1]", ["/mnt/disk[1]"]),
+        ("/a, /srv/[x]", ["/a", "/srv/[x]"]),
+        ("/srv/[x], /b", ["/srv/[x]", "/b"]),
+        ('["AUTO", 5]', ["auto", "5"]),
+        ("", ["auto"]),
+        ("[]", ["auto"]),
+        (["/", " ", 1], ["/", "1"]),
+        ([], ["auto"]),
+    ],
+)
+def test_parse_mounts_variants(value, expected):
+    assert Settings._parse_mounts(value) == expected
@@ -37,13 +37,18 @@ def _sample_metrics(**overrides: Any) -> dict[str, Any]:
     return base
 
 
+@pytest.fixture(scope="module")
+def app_client():
+    # One app and lifespan per module; routes resolve main.repository per request.
+    with TestClient(main.create_app()) as test_client:
+        yield test_client
+
+
 @pytest.fixture
-def client(monkeypatch):
+def client(monkeypatch, app_client):
     repo = DummyRepository()
     monkeypatch.setattr(main, "repository", repo, raising=False)
-    app = main.create_app()
-    with TestClient(app) as test_client:
-        yield test_client, repo
+    return app_client, repo
 
 
 def test_metrics_requires_bearer_token(client):
@@ -68,6 +73,18 @@ def test_metrics_endpoint_records_payload(monkeypatch, client):
     assert isinstance(repo.recorded[0], MetricPayload)
 
 
+def test_metrics_endpoint_omits_raw_payload_unless_requested(monkeypatch, client):
+    test_client, repo = client
+
+    monkeypatch.setattr(main.metrics, "collect_metrics", lambda: _sample_metrics(hostname="raw"))
+    headers = {"Authorization": "Bearer monitor-token"}
+
+    assert "raw_payload" not in test_client.get("/metrics", headers=headers).json()["metrics"]
+
+    response = test_client.get("/metrics", params={"include_raw": "1"}, headers=headers)
+    assert response.json()["metrics"]["raw_payload"]["hostname"] == "raw"
+
+
 def test_latest_metrics_uses_cached_value(monkeypatch, client):
     test_client, repo = client
     repo.latest_payload = MetricPayload(
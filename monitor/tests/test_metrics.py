@@ -28,6 +28,39 @@ def test_resolve_mount_points_combines_configured_and_discovered(monkeypatch):
     assert result == ["/data", "/srv", "/", "/mnt/storage"]
 
 
+def test_discover_mount_points_reuses_recent_scan(monkeypatch):
+    calls = []
+
+    def fake_mountpoints():
+        calls.append(True)
+        return ["/", "/hostfs/data"]
+
+    monkeypatch.setattr(metrics.settings, "host_root_target", "/hostfs", raising=False)
+    monkeypatch.setattr(metrics, "_list_mountpoints", fake_mountpoints)
+    monkeypatch.setattr(metrics, "_MOUNTS_CACHE", {"ts": 0.0, "key": None, "value": None})
+
+    assert metrics._discover_mount_points() == ["/", "/data"]
+    assert metrics._discover_mount_points() == ["/", "/data"]
+    assert len(calls) == 1
+
+    metrics._MOUNTS_CACHE["ts"] -= metrics.MOUNTS_CACHE_TTL_SECONDS
+    metrics._discover_mount_points()
+    assert len(calls) == 2
+
+
+def test_list_mountpoints_reads_mountinfo(monkeypatch, tmp_path):
+    mountinfo = tmp_path / "mountinfo"
+    mountinfo.write_text(
+        "22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw\n"
+        "35 22 8:2 / /mnt/my\\040disk rw,relatime shared:2 - ext4 /dev/sda2 rw\n"
+    )
+    monkeypatch.setattr(metrics.sys, "platform", "linux")
+    monkeypatch.setattr(metrics, "MOUNTINFO_PATH", str(mountinfo))
+    monkeypatch.setattr(metrics.psutil, "disk_partitions", lambda all=False: pytest.fail("psutil fallback used"))
+
+    assert metrics._list_mountpoints() == ["/", "/mnt/my disk"]
+
+
 def test_candidate_paths_respect_host_root_target(monkeypatch):
     monkeypatch.setattr(metrics.settings, "host_root_target", "/hostfs", raising=False)
 
@@ -37,6 +70,44 @@ def test_candidate_paths_respect_host_root_target(monkeypatch):
     assert candidates == ["/hostfs/var/log", "/var/log"]
 
 
+def test_get_disk_usage_remembers_fallback_briefly(monkeypatch):
+    probed = []
+    host_up = False
+    now = [100.0]
+
+    def fake_disk_usage(path):
+        probed.append(path)
+        if path.startswith("/hostfs") and not host_up:
+            raise FileNotFoundError(path)
+        return SimpleNamespace(total=1024**3, percent=10.0, path=path)
+
+    monkeypatch.setattr(metrics.settings, "host_root_target", "/hostfs", raising=False)
+    monkeypatch.setattr(metrics.psutil, "disk_usage", fake_disk_usage)
+    monkeypatch.setattr(metrics.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(metrics, "_USAGE_PATHS", {})
+
+    # A transient failure on the host path falls back to the container path for a short while.
+    assert metrics._get_disk_usage("/data").path == "/data"
+    assert metrics._get_disk_usage("/data").path == "/data"
+    assert probed == ["/hostfs/data", "/data", "/data"]
+
+    # Once the window passes, the host path is preferred again and nothing is pinned.
+    host_up = True
+    now[0] += metrics.MOUNTS_CACHE_TTL_SECONDS
+    assert metrics._get_disk_usage("/data").path == "/hostfs/data"
+    assert metrics._get_disk_usage("/data").path == "/hostfs/data"
+    assert metrics._USAGE_PATHS == {}
+
+
+def test_get_disk_usage_fallback_is_scoped_to_host_root_target(monkeypatch):
+    monkeypatch.setattr(metrics.settings, "host_root_target", "/hostfs", raising=False)
+    monkeypatch.setattr(metrics, "_USAGE_PATHS", {("/data", "/hostfs"): ("/data", metrics.time.monotonic())})
+    monkeypatch.setattr(metrics.psutil, "disk_usage", lambda path: SimpleNamespace(total=1, percent=1.0, path=path))
+
+    monkeypatch.setattr(metrics.settings, "host_root_target", "/host", raising=False)
+    assert metrics._get_disk_usage("/data").path == "/host/data"
+
+
 def test_detect_warnings_flags_all_categories():
     payload = {
         "cpu_temperature_c": 85.2,
@@ -80,7 +151,7 @@ def test_collect_metrics_includes_backend_version(monkeypatch):
     monkeypatch.setattr(metrics.settings, "version", "9.9.9", raising=False)
     monkeypatch.setattr(metrics, "_resolve_mount_points", lambda: ["/"])
     monkeypatch.setattr(metrics, "_get_disk_usage", lambda mount: SimpleNamespace(total=1024**3, percent=50.0))
-    monkeypatch.setattr(metrics, "_get_cpu_temperature", lambda: None)
+    monkeypatch.setattr(metrics, "_get_cpu_temperature", lambda temps=None: None)
     monkeypatch.setattr(metrics.os, "getloadavg", lambda: (0.1, 0.2, 0.3))
     monkeypatch.setattr(metrics.psutil, "virtual_memory", lambda: SimpleNamespace(percent=25.0, total=2 * 1024**3))
     monkeypatch.setattr(metrics.psutil, "boot_time", lambda: 0)
@@ -89,3 +160,21 @@ def test_collect_metrics_includes_backend_version(monkeypatch):
 
     assert payload["backend_version"] == "9.9.9"
     assert payload["mounted_usage"] == [{"mount_point": "/", "total_gb": 1.0, "used_percent": 50.0}]
+
+
+def test_collect_metrics_reads_sensors_once(monkeypatch):
+    calls = []
+
+    def fake_sensors():
+        calls.append(1)
+        return {"coretemp": [SimpleNamespace(label="Core 0", current=60.0)]}
+
+    monkeypatch.setattr(metrics.psutil, "sensors_temperatures", fake_sensors, raising=False)
+    monkeypatch.setattr(metrics, "_resolve_mount_points", lambda: ["/"])
+    monkeypatch.setattr(metrics, "_get_disk_usage", lambda mount: SimpleNamespace(total=1024**3, percent=50.0))
+
+    payload = metrics.collect_metrics()
+
+    assert len(calls) == 1
+    assert payload["cpu_temperature_c"] == 60.0
+    assert payload["disk_temperatures"] == [{"device": "Core 0", "temperature_c": 60.0}]
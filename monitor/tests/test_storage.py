@@ -4,21 +4,30 @@ from datetime import datetime, timedelta, timezone
 from types import SimpleNamespace
 
 import pytest
+from pydantic import ValidationError
 
 from monitor.app import storage
 from monitor.app.schemas import MetricPayload
 
 
-def _payload(report_offset_seconds: int = 0, hostname: str = "host") -> MetricPayload:
-    reported_at = datetime.now(tz=timezone.utc) + timedelta(seconds=report_offset_seconds)
-    return MetricPayload(
-        reported_at=reported_at,
+def _payload(hostname: str = "host") -> MetricPayload:
+    # Trusted fixture data (already aware UTC), so skip validation.
+    return MetricPayload.model_construct(
+        reported_at=datetime.now(tz=timezone.utc),
         hostname=hostname,
     )
 
 
 @pytest.fixture
-def repo(monkeypatch) -> storage.MetricsRepository:
+def clock(monkeypatch) -> SimpleNamespace:
+    # Retention runs on the monotonic clock; tests move it forward explicitly.
+    fake = SimpleNamespace(now=1_000.0)
+    monkeypatch.setattr(storage, "monotonic", lambda: fake.now)
+    return fake
+
+
+@pytest.fixture
+def repo(monkeypatch, clock) -> storage.MetricsRepository:
     monkeypatch.setattr(
         storage,
         "settings",
@@ -28,42 +37,167 @@ def repo(monkeypatch) -> storage.MetricsRepository:
     return storage.MetricsRepository(max_entries=3)
 
 
-@pytest.mark.asyncio
-async def test_record_and_latest_return_cloned_payload(repo):
+async def test_record_and_latest_share_frozen_payload(repo):
     payload = _payload()
     await repo.record(payload)
 
     latest = await repo.latest()
-    assert latest is not None
-    assert latest.hostname == "host"
+    assert latest is payload
 
-    latest.hostname = "mutated"
+    with pytest.raises(ValidationError):
+        latest.hostname = "mutated"
     newest = await repo.latest()
     assert newest.hostname == "host"
 
 
-@pytest.mark.asyncio
-async def test_prune_drops_entries_outside_retention(repo):
-    old_payload = _payload(report_offset_seconds=-3600, hostname="old")
-    fresh_payload = _payload(hostname="fresh")
+async def test_nested_payload_models_are_frozen(repo):
+    payload = MetricPayload(
+        reported_at=datetime.now(tz=timezone.utc),
+        cpu_load={"one": 0.5},
+        mounted_usage=[{"mount_point": "/", "used_percent": 10.0}],
+    )
+    await repo.record(payload)
+    latest = await repo.latest()
+
+    with pytest.raises(ValidationError):
+        latest.cpu_load.one = 9.0
+    with pytest.raises(ValidationError):
+        latest.mounted_usage[0].used_percent = 99.0
+
+
+async def test_payload_collections_cannot_mutate_stored_snapshot(repo):
+    payload = MetricPayload(
+        reported_at=datetime.now(tz=timezone.utc),
+        warnings=["High RAM usage 95.0%"],
+        configured_mounts=["/"],
+        network_counters=[{"interface": "eth0", "bytes_sent": 10, "bytes_recv": 20}],
+        disk_temperatures=[{"device": "nvme0", "temperature_c": 40.0}],
+    )
+    await repo.record(payload)
+    latest = await repo.latest()
+
+    with pytest.raises(AttributeError):
+        latest.warnings.append("injected")
+    with pytest.raises(TypeError):
+        latest.configured_mounts[0] = "/tmp"
+    with pytest.raises(ValidationError):
+        latest.network_counters[0].bytes_sent = 0
+    with pytest.raises(ValidationError):
+        latest.disk_temperatures[0].temperature_c = 0.0
+
+    stored = await repo.latest()
+    assert stored.warnings == ("High RAM usage 95.0%",)
+    assert stored.network_counters[0].bytes_sent == 10
+    assert stored.model_dump(mode="json")["configured_mounts"] == ["/"]
+
+
+def test_payload_reported_at_is_normalized_to_utc():
+    naive = MetricPayload(reported_at=datetime(2026, 1, 1, 12, 0))
+    offset = MetricPayload(reported_at="2026-01-01T14:00:00+02:00")
+
+    assert naive.reported_at == datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    assert offset.reported_at.tzinfo is timezone.utc
+    assert offset.reported_at.hour == 12
 
-    await repo.record(old_payload)
-    await repo.record(fresh_payload)
+
+async def test_prune_drops_entries_outside_retention(repo, clock):
+    await repo.record(_payload(hostname="old"))
+    clock.now += 3600
+    await repo.record(_payload(hostname="fresh"))
 
     await repo.prune()
 
     latest = await repo.latest()
     assert latest is not None
     assert latest.hostname == "fresh"
+    assert repo._size == 1  # noqa: SLF001
+
+
+async def test_latest_cleared_once_everything_expires(repo, clock):
+    await repo.record(_payload(hostname="only"))
+    clock.now += 3600
+
+    await repo.prune()
+
+    assert await repo.latest() is None
+
+
+async def test_retention_ignores_reported_at(repo):
+    await repo.record(
+        MetricPayload(reported_at=datetime.now(tz=timezone.utc) - timedelta(days=1), hostname="skewed")
+    )
+
+    assert (await repo.latest()).hostname == "skewed"
+
+
+async def test_set_retention_applies_to_next_prune(repo, clock):
+    await repo.record(_payload(hostname="older"))
+    clock.now += 120
+    await repo.record(_payload(hostname="fresh"))
+
+    repo.set_retention(timedelta(minutes=1))
+    await repo.prune()
+
+    assert repo._size == 1  # noqa: SLF001
+    assert repo._snapshot_at(0).hostname == "fresh"  # noqa: SLF001
+
+
+async def test_record_batch_keeps_order_and_prunes(repo, clock):
+    await repo.record(_payload(hostname="stale"))
+    clock.now += 3600
+    await repo.record_batch([_payload(hostname="one"), _payload(hostname="two")])
+
+    assert repo._size == 2  # noqa: SLF001
+    assert repo._snapshot_at(0).hostname == "one"  # noqa: SLF001
+    assert (await repo.latest()).hostname == "two"
 
 
-@pytest.mark.asyncio
 async def test_max_entries_enforced(repo):
     await repo.record(_payload(hostname="one"))
     await repo.record(_payload(hostname="two"))
     await repo.record(_payload(hostname="three"))
     await repo.record(_payload(hostname="four"))
 
-    assert len(repo._items) == 3  # noqa: SLF001 - intentional internal check
-    assert repo._items[0].hostname == "two"
-    assert repo._items[-1].hostname == "four"
+    assert repo._size == 3  # noqa: SLF001 - intentional internal check
+    assert repo._snapshot_at(0).hostname == "two"
+    assert repo._snapshot_at(2).hostname == "four"
+    assert (await repo.latest()).hostname == "four"
+
+
+@pytest.mark.parametrize("max_entries", [0, -1])
+async def test_zero_capacity_retains_nothing(clock, max_entries):
+    repo = storage.MetricsRepository(max_entries=max_entries)
+
+    await repo.record(_payload(hostname="dropped"))
+    await repo.record_batch([_payload(hostname="also-dropped")])
+    await repo.prune()
+
+    assert await repo.latest() is None
+    assert repo._size == 0  # noqa: SLF001
+
+
+async def test_prune_across_ring_wraparound(repo, clock):
+    repo.set_retention(timedelta(minutes=1))
+    for hostname in ("a", "b", "c", "d", "e"):
+        await repo.record(_payload(hostname=hostname))
+        clock.now += 90
+
+    assert repo._size == 1  # noqa: SLF001
+    assert repo._items.count(None) == 2  # evicted slots are released
+    assert (await repo.latest()).hostname == "e"
+
+
+async def test_prune_expires_run_spanning_ring_end(repo, clock):
+    for hostname in ("a", "b", "c", "d"):
+        await repo.record(_payload(hostname=hostname))
+        clock.now += 60
+    clock.now += 600
+    await repo.record(_payload(hostname="e"))
+    # The ring holds c, d, e with d and e wrapped to the front; keep only the last minute.
+    repo.set_retention(timedelta(minutes=1))
+    await repo.prune()
+
+    assert repo._size == 1  # noqa: SLF001
+    assert len(repo._items) == 3  # noqa: SLF001
+    assert repo._items.count(None) == 2  # noqa: SLF001
+    assert (await repo.latest()).hostname == "e"